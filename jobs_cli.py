@@ -63,13 +63,14 @@ beautifulsoup4
 google-auth-oauthlib
 google-auth
 google-api-python-client
-html5lib
+lxml
 feedparser
 requests
 
 """
 from __future__ import annotations
 
+import atexit
 import base64
 import builtins
 import json
@@ -78,22 +79,23 @@ import re
 import sqlite3
 import sys
 import webbrowser
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.markdown import Markdown
-from bs4 import BeautifulSoup
-import feedparser
-import requests
+from rich.markup import escape
 
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+# Google API client, BeautifulSoup, feedparser, requests, rich.table and the
+# parsing process pool are imported inside the functions that use them: they
+# dominate startup time and most commands (`jobs`, `apply`, `open`, ...) never
+# need them.
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
 
 app = typer.Typer(add_completion=False, no_args_is_help=False)
 settings_app = typer.Typer(help="Manage filters that decide which jobs appear.")
@@ -125,8 +127,26 @@ GENERIC_JOB_RE = re.compile(r"https?://[^\s\"]+")
 
 # --------------------------- SETTINGS LAYER --------------------------------
 
+# ((st_mtime_ns, st_size) of settings.json or None if missing, normalized settings)
+_SETTINGS_CACHE: Optional[tuple[Optional[tuple[int, int]], dict]] = None
+
+
+def _copy_settings(settings: dict) -> dict:
+    # Callers mutate the lists in place, so never hand out the cached ones
+    return {k: list(v) if isinstance(v, list) else v for k, v in settings.items()}
+
+
 def load_settings() -> dict:
-    if SETTINGS_PATH.exists():
+    global _SETTINGS_CACHE
+    try:
+        st = SETTINGS_PATH.stat()
+        cache_key = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        cache_key = None
+    if _SETTINGS_CACHE is not None and _SETTINGS_CACHE[0] == cache_key:
+        return _copy_settings(_SETTINGS_CACHE[1])
+
+    if cache_key is not None:
         try:
             data = json.loads(SETTINGS_PATH.read_text())
         except json.JSONDecodeError:
@@ -151,20 +171,50 @@ def load_settings() -> dict:
             except (TypeError, ValueError):
                 merged[key] = DEFAULT_SETTINGS[key]
             merged[key] = max(0, merged[key])
-    return merged
+
+    _SETTINGS_CACHE = (cache_key, merged)
+    return _copy_settings(merged)
+
+
+def _write_settings_file(data: dict) -> bool:
+    """Write settings.json unless it already holds exactly these bytes."""
+    new_bytes = json.dumps(data, indent=2, sort_keys=True).encode()
+    try:
+        if SETTINGS_PATH.read_bytes() == new_bytes:
+            return False
+    except FileNotFoundError:
+        pass
+    SETTINGS_PATH.write_bytes(new_bytes)
+    return True
 
 
 def save_settings(data: dict) -> None:
     filtered = {k: data.get(k, DEFAULT_SETTINGS[k]) for k in DEFAULT_SETTINGS}
-    SETTINGS_PATH.write_text(json.dumps(filtered, indent=2, sort_keys=True))
-    console.print(f"[green]Saved settings to {SETTINGS_PATH}[/green]")
+    if _write_settings_file(filtered):
+        console.print(f"[green]Saved settings to {SETTINGS_PATH}[/green]")
+    else:
+        console.print("[yellow]Settings unchanged; nothing to save.[/yellow]")
 
 
 # --------------------------- DB LAYER --------------------------------------
 
-def db() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+# Applied on every open; journal_mode=WAL is persistent and idempotent.
+# WAL requires SQLite >= 3.7.0.
+DB_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA mmap_size=268435456;
+"""
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH, cached_statements=256)
     conn.row_factory = sqlite3.Row
+    # SQLite's LOWER() only folds ASCII; filters need str.lower() semantics (Å, Ø, Æ)
+    conn.create_function("py_lower", 1, _normalize, deterministic=True)
+    conn.executescript(DB_PRAGMAS)
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS jobs (
@@ -182,17 +232,73 @@ def db() -> sqlite3.Connection:
         )
         """
     )
+    # link UNIQUE already has its own automatic index
+    conn.execute("DROP INDEX IF EXISTS idx_jobs_link")
+    # Serves the default list query (WHERE applied=0 AND ignored=0 ORDER BY created_at DESC)
     conn.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_jobs_link ON jobs(link);
+        CREATE INDEX IF NOT EXISTS idx_jobs_active_recent
+        ON jobs(applied, ignored, created_at DESC);
         """
     )
     return conn
 
 
+# Process-wide connection, opened lazily by _connection() and closed at exit
+_CONN: Optional[sqlite3.Connection] = None
+
+
+def _connection() -> sqlite3.Connection:
+    global _CONN
+    if _CONN is None:
+        _CONN = _connect()
+    return _CONN
+
+
+def close_db() -> None:
+    global _CONN
+    if _CONN is None:
+        return
+    # Let SQLite refresh planner statistics for the tables we touched
+    _CONN.execute("PRAGMA optimize")
+    _CONN.close()
+    _CONN = None
+
+
+atexit.register(close_db)
+
+
+@contextmanager
+def db() -> Iterator[sqlite3.Connection]:
+    """Use the shared jobs connection; commits on success and rolls back on error."""
+    conn = _connection()
+    with conn:
+        yield conn
+
+
+# Stay under SQLITE_MAX_VARIABLE_NUMBER, which is 999 on older SQLite builds
+SQL_VARIABLE_CHUNK = 900
+
+
+def _existing_links(conn: sqlite3.Connection, links: list[str]) -> set[str]:
+    """Return which of `links` are already stored, using indexed IN lookups."""
+    existing: set[str] = set()
+    for start in range(0, len(links), SQL_VARIABLE_CHUNK):
+        chunk = links[start:start + SQL_VARIABLE_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        cur = conn.execute(f"SELECT link FROM jobs WHERE link IN ({placeholders})", chunk)
+        existing.update(r[0] for r in cur)
+    return existing
+
+
 # --------------------------- GMAIL AUTH ------------------------------------
 
 def gmail_service():
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from googleapiclient.discovery import build
+
     creds = None
     if TOKEN_PATH.exists():
         creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
@@ -221,19 +327,35 @@ LINKEDIN_SUBJECT_PATTERNS = (
 )
 
 
+SUBJECT_RE = re.compile(
+    "|".join(re.escape(p) for p in LINKEDIN_SUBJECT_PATTERNS), re.IGNORECASE
+)
+
+
 def _is_job_alert_subject(subj: str) -> bool:
-    s = subj.lower()
-    return any(p.lower() in s for p in LINKEDIN_SUBJECT_PATTERNS)
+    return SUBJECT_RE.search(subj) is not None
+
+
+JOB_LINK_RE = re.compile(r"linkedin\.com/jobs|lever\.co|greenhouse\.io|workable\.com|ashbyhq\.com")
+
+
+def _make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    from bs4 import BeautifulSoup, FeatureNotFound
+
+    # lxml is a C parser and much faster than html5lib; fall back if it is missing
+    try:
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser", parse_only=parse_only)
 
 
 def _extract_links_from_html(html: str) -> Iterable[str]:
-    soup = BeautifulSoup(html, "html5lib")
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "linkedin.com/jobs" in href:
-            yield href
-        elif any(d in href for d in ["lever.co", "greenhouse.io", "workable.com", "ashbyhq.com"]):
-            yield href
+    from bs4 import SoupStrainer
+
+    # Only hrefs are needed here, so skip building the rest of the tree
+    soup = _make_soup(html, parse_only=SoupStrainer("a", href=True))
+    for a in soup.find_all("a", href=JOB_LINK_RE):
+        yield a["href"]
 
 
 def _guess_title_company_from_anchor(a_tag) -> tuple[Optional[str], Optional[str]]:
@@ -258,15 +380,11 @@ def _guess_location(a_tag) -> Optional[str]:
 
 
 def parse_email_payload_to_jobs(html: str, source: str = "LinkedIn") -> list[dict]:
-    soup = BeautifulSoup(html, "html5lib")
+    # Full tree is kept: _guess_location reads the anchor's surrounding markup
+    soup = _make_soup(html)
     jobs = []
-    for a in soup.find_all("a", href=True):
+    for a in soup.find_all("a", href=JOB_LINK_RE):
         href = a["href"]
-        if not (
-            "linkedin.com/jobs" in href
-            or any(d in href for d in ["lever.co", "greenhouse.io", "workable.com", "ashbyhq.com"])
-        ):
-            continue
         title, company = _guess_title_company_from_anchor(a)
         location = _guess_location(a)
         jobs.append(
@@ -274,7 +392,7 @@ def parse_email_payload_to_jobs(html: str, source: str = "LinkedIn") -> list[dic
                 title=title,
                 company=company,
                 location=location,
-                link=href.split("?")[0],
+                link=href.partition("?")[0],
                 source=source,
                 posted_at=None,
             )
@@ -284,76 +402,171 @@ def parse_email_payload_to_jobs(html: str, source: str = "LinkedIn") -> list[dic
 
 # --------------------------- FETCH FROM GMAIL -------------------------------
 
+# Gmail's batch endpoint accepts at most 100 sub-requests per HTTP call
+GMAIL_BATCH_SIZE = 100
+
+# How many levels of nested MIME parts to request from Gmail
+MIME_PARTS_DEPTH = 5
+
+
+def _mime_parts_mask(depth: int) -> str:
+    node = "mimeType,body/data"
+    for _ in range(depth):
+        node = f"mimeType,body/data,parts({node})"
+    return node
+
+
+# Partial response: only the headers and MIME parts needed to find the HTML body
+FIELDS_MASK = f"payload(headers(name,value),{_mime_parts_mask(MIME_PARTS_DEPTH)})"
+
+
+def _gmail_query() -> str:
+    # Quote each pattern so Gmail matches the phrase, not the individual words
+    return " OR ".join(f'subject:"{p}"' for p in LINKEDIN_SUBJECT_PATTERNS)
+
+
+def _get_message_request(service, message_id: str):
+    return service.users().messages().get(
+        userId="me", id=message_id, format="full", fields=FIELDS_MASK
+    )
+
+
+def _fetch_messages(service, message_ids: list[str]) -> list[dict]:
+    """Fetch full messages in batches of GMAIL_BATCH_SIZE, preserving order."""
+    fetched: dict[str, dict] = {}
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            fetched[request_id] = response
+
+    for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+        chunk = message_ids[start:start + GMAIL_BATCH_SIZE]
+        batch = service.new_batch_http_request(callback=_collect)
+        for message_id in chunk:
+            batch.add(_get_message_request(service, message_id), request_id=message_id)
+        try:
+            batch.execute()
+        except Exception as e:
+            console.print(f"[yellow]Batch request failed ({e}); fetching individually.[/yellow]")
+
+    # Retry anything the batch dropped (e.g. rate-limited sub-requests) one by one.
+    # The discovery client is not thread-safe, so this stays sequential.
+    for message_id in message_ids:
+        if message_id in fetched:
+            continue
+        try:
+            fetched[message_id] = _get_message_request(service, message_id).execute()
+        except Exception as e:
+            console.print(f"[red]Error fetching message {message_id}: {e}[/red]")
+
+    return [fetched[mid] for mid in message_ids if mid in fetched]
+
+
+def _find_html(payload: dict) -> Optional[str]:
+    """Return the base64 data of the shallowest text/html part, at any nesting depth."""
+    queue = deque([payload])
+    while queue:
+        part = queue.popleft()
+        if part.get("mimeType") == "text/html":
+            data = part.get("body", {}).get("data")
+            if data:
+                return data
+        queue.extend(part.get("parts", ()))
+    return None
+
+
+# Parsing is CPU-bound pure-Python tree building (threads would contend on the
+# GIL), so it fans out to processes once there is enough work to pay for them
+PARSE_PROCESS_MIN_MESSAGES = 8
+
+
+def _parse_message(full: dict) -> list[dict]:
+    """Extract jobs from one fetched Gmail message; runs in worker processes."""
+    headers = {h["name"].lower(): h["value"] for h in full.get("payload", {}).get("headers", [])}
+    subject = headers.get("subject", "(no subject)")
+    if not _is_job_alert_subject(subject):
+        return []
+
+    html_payload = _find_html(full.get("payload", {}))
+    if not html_payload:
+        return []
+
+    html = base64.urlsafe_b64decode(html_payload).decode("utf-8", errors="ignore")
+    return parse_email_payload_to_jobs(html, source="LinkedIn Email")
+
+
+def _parse_messages(fulls: list[dict]) -> list[list[dict]]:
+    """Parse messages in parallel when worthwhile; results keep message order."""
+    workers = min(os.cpu_count() or 1, len(fulls))
+    if workers > 1 and len(fulls) >= PARSE_PROCESS_MIN_MESSAGES:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(fulls) // (workers * 4))
+                return list(executor.map(_parse_message, fulls, chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            console.print(f"[yellow]Parallel parsing unavailable ({e}); parsing serially.[/yellow]")
+    return [_parse_message(full) for full in fulls]
+
+
 def fetch_from_gmail(max_results: int = 50):
     service = gmail_service()
-    q = " OR ".join([f"subject:{p}" for p in LINKEDIN_SUBJECT_PATTERNS])
     results = (
         service.users()
         .messages()
-        .list(userId="me", q=q, maxResults=max_results)
+        .list(userId="me", q=_gmail_query(), maxResults=max_results)
         .execute()
     )
     messages = results.get("messages", [])
+    fulls = _fetch_messages(service, [m["id"] for m in messages])
+
+    created_at = datetime.now(timezone.utc).isoformat()
+    parsed: dict[str, tuple] = {}
+    for jobs in _parse_messages(fulls):
+        for j in jobs:
+            # Alerts repeat the same job; keep the first occurrence per link
+            parsed.setdefault(
+                j.get("link"),
+                (
+                    j.get("title"),
+                    j.get("company"),
+                    j.get("location"),
+                    j.get("link"),
+                    j.get("source"),
+                    j.get("posted_at"),
+                    created_at,
+                ),
+            )
+
+    if not parsed:
+        return 0
 
-    total_new = 0
     with db() as conn:
-        for m in messages:
-            full = service.users().messages().get(userId="me", id=m["id"]).execute()
-            headers = {h["name"].lower(): h["value"] for h in full.get("payload", {}).get("headers", [])}
-            subject = headers.get("subject", "(no subject)")
-            if not _is_job_alert_subject(subject):
-                continue
-
-            payload = full.get("payload", {})
-            html_payload = None
-
-            parts = payload.get("parts", [])
-            for p in parts:
-                if p.get("mimeType") == "text/html":
-                    html_payload = p.get("body", {}).get("data")
-                    break
-                if p.get("mimeType") == "multipart/alternative":
-                    for pp in p.get("parts", []):
-                        if pp.get("mimeType") == "text/html":
-                            html_payload = pp.get("body", {}).get("data")
-                            break
-                if html_payload:
-                    break
-            if not html_payload and payload.get("mimeType") == "text/html":
-                html_payload = payload.get("body", {}).get("data")
-            if not html_payload:
-                continue
-
-            html = base64.urlsafe_b64decode(html_payload).decode("utf-8", errors="ignore")
-            jobs = parse_email_payload_to_jobs(html, source="LinkedIn Email")
-
-            for j in jobs:
-                try:
-                    conn.execute(
-                        """
-                        INSERT INTO jobs (title, company, location, link, source, posted_at, created_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            j.get("title"),
-                            j.get("company"),
-                            j.get("location"),
-                            j.get("link"),
-                            j.get("source"),
-                            j.get("posted_at"),
-                            datetime.now(timezone.utc).isoformat(),
-                        ),
-                    )
-                    total_new += 1
-                except sqlite3.IntegrityError:
-                    pass
-    return total_new
+        existing = _existing_links(conn, list(parsed))
+        to_insert = [row for link, row in parsed.items() if link not in existing]
+        if not to_insert:
+            return 0
+        # One statement, one transaction; OR IGNORE still guards against races
+        cur = conn.executemany(
+            """
+            INSERT OR IGNORE INTO jobs (title, company, location, link, source, posted_at, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            to_insert,
+        )
+        return cur.rowcount
 
 
 # --------------------------- FETCH FROM RSS ------------------------------------
 
 def fetch_from_rss():
     """Fetch jobs from configured RSS feeds."""
+    import feedparser
+    import requests
+    from bs4 import BeautifulSoup
+
     settings = load_settings()
     rss_feeds = settings.get("rss_feeds", [])
 
@@ -383,8 +596,7 @@ def fetch_from_rss():
                     link = entry.get("link", "")
 
                     # Clean up the link (remove tracking parameters)
-                    if "?" in link:
-                        link = link.split("?")[0]
+                    link = link.partition("?")[0]
 
                     # Try to extract company and location from summary/description
                     summary = entry.get("summary", "") or entry.get("description", "")
@@ -452,95 +664,123 @@ def _normalize(value: Optional[str]) -> str:
     return (value or "").strip().lower()
 
 
-def job_matches_filters(row: sqlite3.Row, filters: dict, include_all: bool) -> bool:
-    if include_all:
-        return True
-
-    title = _normalize(row["title"])
-    company = _normalize(row["company"])
-    location = _normalize(row["location"])
+# (column, settings suffix) pairs; each yields include_<suffix> / exclude_<suffix>
+FILTER_COLUMNS = (("title", "titles"), ("company", "companies"), ("location", "locations"))
 
-    include_titles = [_normalize(v) for v in filters["include_titles"]]
-    if include_titles and not any(t in title for t in include_titles):
-        return False
 
-    exclude_titles = [_normalize(v) for v in filters["exclude_titles"]]
-    if exclude_titles and any(t in title for t in exclude_titles):
-        return False
+@lru_cache(maxsize=64)
+def _filter_sql_template(counts: tuple[tuple[int, int], ...], has_age: bool) -> str:
+    clauses = []
+    for (column, _), (n_include, n_exclude) in zip(FILTER_COLUMNS, counts):
+        contains = f"instr(py_lower({column}), ?) > 0"
+        if n_include:
+            clauses.append("(" + " OR ".join([contains] * n_include) + ")")
+        if n_exclude:
+            clauses.append("NOT (" + " OR ".join([contains] * n_exclude) + ")")
+    if has_age:
+        clauses.append("created_at >= ?")
+    return " AND ".join(clauses)
 
-    include_companies = [_normalize(v) for v in filters["include_companies"]]
-    if include_companies and not any(c in company for c in include_companies):
-        return False
 
-    exclude_companies = [_normalize(v) for v in filters["exclude_companies"]]
-    if exclude_companies and any(c in company for c in exclude_companies):
-        return False
+def _minimal_terms(terms: Iterable[str]) -> list[str]:
+    # In an OR of substring tests "senior engineer" is implied by "engineer"
+    kept: list[str] = []
+    for term in sorted(set(terms), key=len):
+        if not any(k in term for k in kept):
+            kept.append(term)
+    return kept
 
-    include_locations = [_normalize(v) for v in filters["include_locations"]]
-    if include_locations and not any(loc in location for loc in include_locations):
-        return False
 
-    exclude_locations = [_normalize(v) for v in filters["exclude_locations"]]
-    if exclude_locations and any(loc in location for loc in exclude_locations):
-        return False
+def normalize_filters(filters: dict) -> dict:
+    """Normalize filter terms and resolve the age cutoff once per listing."""
+    norm = {}
+    for _, suffix in FILTER_COLUMNS:
+        for field in (f"include_{suffix}", f"exclude_{suffix}"):
+            norm[field] = _minimal_terms(_normalize(v) for v in filters[field])
 
     max_age_days = filters.get("max_age_days", 0)
+    norm["age_cutoff_iso"] = None
     if max_age_days:
-        created_at = row["created_at"]
-        if created_at:
-            try:
-                created_dt = datetime.fromisoformat(created_at)
-                if created_dt.tzinfo is None:
-                    created_dt = created_dt.replace(tzinfo=timezone.utc)
-                if datetime.now(timezone.utc) - created_dt > timedelta(days=max_age_days):
-                    return False
-            except ValueError:
-                pass
+        # created_at is stored as UTC ISO-8601, which sorts lexicographically
+        cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+        norm["age_cutoff_iso"] = cutoff.isoformat()
+    return norm
 
-    return True
+
+def build_filter_sql(norm_filters: dict) -> tuple[str, list]:
+    """Translate normalize_filters() output into a parameterized WHERE fragment ("" if none)."""
+    counts = []
+    params: list = []
+    for _, suffix in FILTER_COLUMNS:
+        include = norm_filters[f"include_{suffix}"]
+        exclude = norm_filters[f"exclude_{suffix}"]
+        counts.append((len(include), len(exclude)))
+        params.extend(include)
+        params.extend(exclude)
+
+    age_cutoff_iso = norm_filters["age_cutoff_iso"]
+    if age_cutoff_iso:
+        params.append(age_cutoff_iso)
+
+    return _filter_sql_template(tuple(counts), bool(age_cutoff_iso)), params
 
 
 # --------------------------- DISPLAY ---------------------------------------
 
-def format_row(row: sqlite3.Row) -> str:
-    title = row["title"] or "(Job)"
-    company = row["company"] or "(Company)"
-    loc = f" — {row['location']}" if row["location"] else ""
+def format_row(
+    job_id: int,
+    title: Optional[str],
+    company: Optional[str],
+    location: Optional[str],
+    link: Optional[str],
+) -> str:
+    # Scraped text may contain [brackets]; keep it out of Rich markup parsing
+    title = escape(title or "(Job)")
+    company = escape(company or "(Company)")
+    loc = f" — {escape(location)}" if location else ""
     return (
         f"• [bold]{title}[/bold] at [italic]{company}[/italic]{loc}\n"
-        f"  [link={row['link']}]Open[/link]  · id={row['id']}"
+        f"  [link={link}]Open[/link]  · id={job_id}"
     )
 
 
 def list_jobs(show_all: bool = False, limit: int = 50, apply_filters: bool = True):
-    filters = load_settings() if apply_filters else DEFAULT_SETTINGS
-    include_all = show_all or not apply_filters
-
-    sql = "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?"
-    params = (limit,)
+    clauses = []
+    params: list = []
     if not show_all:
-        sql = (
-            "SELECT * FROM jobs WHERE applied=0 AND ignored=0 "
-            "ORDER BY created_at DESC LIMIT ?"
-        )
+        clauses.append("applied=0 AND ignored=0")
+        if apply_filters:
+            where_sql, filter_params = build_filter_sql(normalize_filters(load_settings()))
+            if where_sql:
+                clauses.append(where_sql)
+                params.extend(filter_params)
+
+    sql = "SELECT id, title, company, location, link FROM jobs"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+    printed = 0
     with db() as conn:
-        rows = conn.execute(sql, params).fetchall()
-
-    if apply_filters:
-        rows = [r for r in rows if job_matches_filters(r, filters, include_all)]
-    else:
-        rows = list(rows)
-
-    if not rows:
+        # Filters and LIMIT are applied in SQL, so rows can be printed as they arrive
+        cur = conn.cursor()
+        cur.row_factory = None  # plain tuples; no per-column name lookups
+        for job_id, title, company, location, link in cur.execute(sql, params):
+            console.print(format_row(job_id, title, company, location, link))
+            printed += 1
+
+    if not printed:
         console.print("[green]No jobs to show.[/green]")
-        return
-
-    for r in rows:
-        console.print(Markdown(format_row(r)))
 
 
 # --------------------------- COMMAND HELPERS -------------------------------
 
+@lru_cache(maxsize=64)
+def _update_sql(columns: tuple[str, ...]) -> str:
+    assignments = ", ".join(f"{col}=?" for col in columns)
+    return f"UPDATE jobs SET {assignments} WHERE id=?"
+
+
 def _update_job(job_id: int, **fields):
     timestamp = datetime.now(timezone.utc).isoformat()
     if "seen_at" not in fields:
@@ -550,11 +790,7 @@ def _update_job(job_id: int, **fields):
         if not cur:
             console.print(f"[red]No job with id {job_id}[/red]")
             raise typer.Exit(1)
-        assignments = ", ".join(f"{col}=?" for col in fields)
-        conn.execute(
-            f"UPDATE jobs SET {assignments} WHERE id=?",
-            (*fields.values(), job_id),
-        )
+        conn.execute(_update_sql(tuple(fields)), (*fields.values(), job_id))
     console.print(f"[green]Updated job {job_id}.[/green]")
 
 
@@ -644,8 +880,12 @@ def reset(confirm: bool = typer.Option(False, help="Confirm database wipe")):
     if not confirm:
         console.print("[red]Refusing to reset without --confirm[/red]")
         raise typer.Exit(1)
-    if DB_PATH.exists():
-        DB_PATH.unlink()
+    close_db()
+    # WAL mode keeps -wal/-shm files next to the database
+    for suffix in ("", "-wal", "-shm"):
+        path = DB_PATH.with_name(DB_PATH.name + suffix)
+        if path.exists():
+            path.unlink()
     console.print("[yellow]Database removed.[/yellow]")
 
 
@@ -676,6 +916,8 @@ def _ensure_list_field(field: str):
 @settings_app.command("show")
 def settings_show():
     """Display current filter settings."""
+    from rich.table import Table
+
     settings = load_settings()
     table = Table(title="Job Filters")
     table.add_column("Field", style="cyan")
@@ -759,7 +1001,7 @@ def settings_reset(confirm: bool = typer.Option(False, help="Confirm reset to de
 def settings_main():
     """Manage filter settings used to decide which jobs to show."""
     if not SETTINGS_PATH.exists():
-        SETTINGS_PATH.write_text(json.dumps(DEFAULT_SETTINGS, indent=2, sort_keys=True))
+        _write_settings_file(DEFAULT_SETTINGS)
 
 
 app.add_typer(settings_app, name="settings")